@@ -175,6 +175,17 @@ class RenderedTaskInstanceFields(Base):
                 cls.task_id == task_id,
                 tuple_(cls.dag_id, cls.task_id, cls.execution_date).notin_(subq2),
             ).delete(synchronize_session=False)
+        elif session.bind.dialect.name in ["mssql"]:
+            # Fetch Top X records given dag_id & task_id ordered by Execution Date
+            # MSSQL does not support tuple comparison, but dag_id and task_id are already
+            # fixed here, so matching on execution_date alone is enough to do it in one query
+            subq1 = tis_to_keep_query.subquery('subq1')
+
+            session.query(cls).filter(
+                cls.dag_id == dag_id,
+                cls.task_id == task_id,
+                cls.execution_date.notin_(session.query(subq1.c.execution_date)),
+            ).delete(synchronize_session=False)
         else:
             # Fetch Top X records given dag_id & task_id ordered by Execution Date
             tis_to_keep = tis_to_keep_query.all()
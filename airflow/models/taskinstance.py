@@ -17,6 +17,7 @@
 # under the License.
 import contextlib
 import hashlib
+import json
 import logging
 import math
 import os
@@ -40,6 +41,7 @@ from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.elements import BooleanClauseList
 
 from airflow import settings
+from airflow.compat.functools import cache
 from airflow.configuration import conf
 from airflow.exceptions import (
     AirflowException,
@@ -62,7 +64,7 @@ from airflow.plugins_manager import integrate_macros_plugins
 from airflow.sentry import Sentry
 from airflow.stats import Stats
 from airflow.ti_deps.dep_context import DepContext
-from airflow.ti_deps.dependencies_deps import REQUEUEABLE_DEPS, RUNNING_DEPS
+from airflow.ti_deps.dependencies_deps import NON_REQUEUEABLE_DEPS, REQUEUEABLE_DEPS
 from airflow.typing_compat import Literal
 from airflow.utils import timezone
 from airflow.utils.email import send_email
@@ -76,14 +78,6 @@ from airflow.utils.sqlalchemy import UtcDateTime
 from airflow.utils.state import DagRunState, State
 from airflow.utils.timeout import timeout
 
-try:
-    from kubernetes.client.api_client import ApiClient
-
-    from airflow.kubernetes.kube_config import KubeConfig
-    from airflow.kubernetes.pod_generator import PodGenerator
-except ImportError:
-    ApiClient = None
-
 TR = TaskReschedule
 Context = Dict[str, Any]
 
@@ -110,6 +104,43 @@ def set_current_context(context: Context):
             )
 
 
+@cache
+def _get_default_email_template(source: str) -> jinja2.Template:
+    """
+    Compile one of the default email alert templates.
+
+    The default templates are constant, so they are compiled once per process and
+    shared across task instances instead of being recompiled for every alert.
+    """
+    jinja_env = jinja2.Environment(loader=jinja2.FileSystemLoader(os.path.dirname(__file__)), autoescape=True)
+    return jinja_env.from_string(source)
+
+
+class _TemplateVariableAccessor:
+    """
+    Base for the ``var`` template accessors returned by ``get_template_context``.
+
+    While ``TaskInstance.render_templates`` is running, ``_cache`` is a dict and raw
+    variable values are cached in it, so a variable referenced from several template
+    fields is looked up once per render. Outside rendering ``_cache`` is None and every
+    access reads the current value.
+    """
+
+    def __init__(self):
+        self.var = None
+        self._cache: Optional[Dict[str, str]] = None
+
+    def _get_raw(self, item: str) -> str:
+        if self._cache is None:
+            return Variable.get(item)
+        if item not in self._cache:
+            self._cache[item] = Variable.get(item)
+        return self._cache[item]
+
+    def __repr__(self):
+        return str(self.var)
+
+
 def load_error_file(fd: IO[bytes]) -> Optional[Union[str, Exception]]:
     """Load and return error from error file"""
     if fd.closed:
@@ -917,8 +948,14 @@ class TaskInstance(Base, LoggingMixin):
 
     @provide_session
     def get_failed_dep_statuses(self, dep_context=None, session=None):
-        """Get failed Dependencies"""
+        """
+        Get failed Dependencies
+
+        The statuses are evaluated eagerly so that all dependency checks run inside
+        the session provided by ``provide_session``, rather than after it was closed.
+        """
         dep_context = dep_context or DepContext()
+        failed_dep_statuses = []
         for dep in dep_context.deps | self.task.deps:
             for dep_status in dep.get_dep_statuses(self, session, dep_context):
 
@@ -931,7 +968,8 @@ class TaskInstance(Base, LoggingMixin):
                 )
 
                 if not dep_status.passed:
-                    yield dep_status
+                    failed_dep_statuses.append(dep_status)
+        return failed_dep_statuses
 
     def __repr__(self):
         return f"<TaskInstance: {self.dag_id}.{self.task_id} {self.execution_date} [{self.state}]>"
@@ -1053,7 +1091,7 @@ class TaskInstance(Base, LoggingMixin):
             # Firstly find non-runnable and non-requeueable tis.
             # Since mark_success is not set, we do nothing.
             non_requeueable_dep_context = DepContext(
-                deps=RUNNING_DEPS - REQUEUEABLE_DEPS,
+                deps=NON_REQUEUEABLE_DEPS,
                 ignore_all_deps=ignore_all_deps,
                 ignore_ti_state=ignore_ti_state,
                 ignore_depends_on_past=ignore_depends_on_past,
@@ -1590,26 +1628,20 @@ class TaskInstance(Base, LoggingMixin):
         if conf.getboolean('core', 'dag_run_conf_overrides_params'):
             self.overwrite_params_with_dag_run_conf(params=params, dag_run=dag_run)
 
-        class VariableAccessor:
+        class VariableAccessor(_TemplateVariableAccessor):
             """
             Wrapper around Variable. This way you can get variables in
             templates by using ``{{ var.value.variable_name }}`` or
             ``{{ var.value.get('variable_name', 'fallback') }}``.
             """
 
-            def __init__(self):
-                self.var = None
-
             def __getattr__(
                 self,
                 item: str,
             ):
-                self.var = Variable.get(item)
+                self.var = self._get_raw(item)
                 return self.var
 
-            def __repr__(self):
-                return str(self.var)
-
             @staticmethod
             def get(
                 item: str,
@@ -1618,26 +1650,21 @@ class TaskInstance(Base, LoggingMixin):
                 """Get Airflow Variable value"""
                 return Variable.get(item, default_var=default_var)
 
-        class VariableJsonAccessor:
+        class VariableJsonAccessor(_TemplateVariableAccessor):
             """
             Wrapper around Variable. This way you can get variables in
             templates by using ``{{ var.json.variable_name }}`` or
             ``{{ var.json.get('variable_name', {'fall': 'back'}) }}``.
             """
 
-            def __init__(self):
-                self.var = None
-
             def __getattr__(
                 self,
                 item: str,
             ):
-                self.var = Variable.get(item, deserialize_json=True)
+                # Deserialize on every access so callers never share a mutable value
+                self.var = json.loads(self._get_raw(item))
                 return self.var
 
-            def __repr__(self):
-                return str(self.var)
-
             @staticmethod
             def get(
                 item: str,
@@ -1756,11 +1783,30 @@ class TaskInstance(Base, LoggingMixin):
         if not context:
             context = self.get_template_context()
 
-        self.task.render_template_fields(context)
+        # Variable lookups are only cached for the duration of rendering. The same context is
+        # passed on to execute(), sensor pokes and callbacks, which must see current values.
+        var = context.get('var')
+        var_accessors = (
+            [accessor for accessor in var.values() if isinstance(accessor, _TemplateVariableAccessor)]
+            if isinstance(var, dict)
+            else []
+        )
+        for accessor in var_accessors:
+            accessor._cache = {}
+        try:
+            self.task.render_template_fields(context)
+        finally:
+            for accessor in var_accessors:
+                accessor._cache = None
 
     def render_k8s_pod_yaml(self) -> Optional[dict]:
         """Render k8s pod yaml"""
+        # Imported here so that the kubernetes client is only loaded when it is needed
+        from kubernetes.client.api_client import ApiClient
+
+        from airflow.kubernetes.kube_config import KubeConfig
         from airflow.kubernetes.kubernetes_helper_functions import create_pod_id  # Circular import
+        from airflow.kubernetes.pod_generator import PodGenerator
 
         kube_config = KubeConfig()
         pod = PodGenerator.construct_pod(
@@ -1819,12 +1865,9 @@ class TaskInstance(Base, LoggingMixin):
                     max_tries=self.max_tries,
                 )
             )
-            jinja_env = jinja2.Environment(
-                loader=jinja2.FileSystemLoader(os.path.dirname(__file__)), autoescape=True
-            )
-            subject = jinja_env.from_string(default_subject).render(**jinja_context)
-            html_content = jinja_env.from_string(default_html_content).render(**jinja_context)
-            html_content_err = jinja_env.from_string(default_html_content_err).render(**jinja_context)
+            subject = _get_default_email_template(default_subject).render(**jinja_context)
+            html_content = _get_default_email_template(default_html_content).render(**jinja_context)
+            html_content_err = _get_default_email_template(default_html_content_err).render(**jinja_context)
 
         else:
             jinja_context = self.get_template_context()
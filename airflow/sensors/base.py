@@ -40,6 +40,7 @@ from airflow.utils import timezone
 # Google Provider before 3.0.0 imported apply_defaults from here.
 # See  https://github.com/apache/airflow/issues/16035
 from airflow.utils.decorators import apply_defaults
+from airflow.utils.session import create_session
 
 
 class BaseSensorOperator(BaseOperator, SkipMixin):
@@ -207,11 +208,16 @@ class BaseSensorOperator(BaseOperator, SkipMixin):
             # If reschedule, use the start date of the first try (first try can be either the very
             # first execution of the task, or the first execution after the task was cleared.)
             first_try_number = context['ti'].max_tries - self.retries + 1
-            task_reschedules = TaskReschedule.find_for_task_instance(
-                context['ti'], try_number=first_try_number
-            )
-            if task_reschedules:
-                started_at = task_reschedules[0].start_date
+            with create_session() as session:
+                first_reschedule = (
+                    TaskReschedule.query_for_task_instance(
+                        context['ti'], try_number=first_try_number, session=session
+                    )
+                    .with_entities(TaskReschedule.start_date)
+                    .first()
+                )
+            if first_reschedule:
+                started_at = first_reschedule.start_date
             else:
                 started_at = timezone.utcnow()
 
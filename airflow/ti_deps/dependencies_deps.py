@@ -57,6 +57,10 @@ RUNNING_DEPS = {
     TaskNotRunningDep(),
 }
 
+# Dependencies that need to be met for a given task instance to be set to 'RUNNING' state,
+# and that will not be re-checked by re-queueing the task instance if they fail.
+NON_REQUEUEABLE_DEPS = RUNNING_DEPS - REQUEUEABLE_DEPS
+
 BACKFILL_QUEUED_DEPS = {
     RunnableExecDateDep(),
     ValidStateDep(BACKFILL_QUEUEABLE_STATES),